@@ -49,7 +49,7 @@ __bugtracker__ = "https://github.com/parafoxia/analytix/issues"
 __ci__ = "https://github.com/parafoxia/analytix/actions"
 __changelog__ = "https://github.com/parafoxia/analytix/releases"
 
-from pkg_resources import working_set
+from importlib.util import find_spec
 
 
 def can_use(package: str) -> bool:
@@ -64,7 +64,12 @@ def can_use(package: str) -> bool:
         Whether the given package can be used.
     """
 
-    return package in [p.key for p in working_set]
+    # This avoids importing pkg_resources, which is slow to import,
+    # and doesn't import the package itself. Namespace packages (such
+    # as a stray directory of the same name) have no origin, so they
+    # don't count.
+    spec = find_spec(package)
+    return spec is not None and spec.origin is not None
 
 
 API_BASE_URL = "https://youtubeanalytics.googleapis.com/v2/reports?"
@@ -37,7 +37,7 @@ import typing as t
 import httpx
 
 import analytix
-from analytix import errors, oauth, ux
+from analytix import errors, oauth, utils, ux
 from analytix.queries import Query
 from analytix.reports import Report
 from analytix.secrets import Secrets
@@ -452,11 +452,13 @@ class Analytics:
 
         assert self._tokens is not None
         headers = {"Authorization": f"Bearer {self._tokens.access_token}"}
-        resp = self._session.get(query.url, headers=headers)
-        data = resp.json()
+        resp = self._session.get(
+            analytix.API_BASE_URL, params=query.params, headers=headers
+        )
+        data = utils.load_json(resp.content)
         _log.debug(f"Data retrieved: {data}")
 
-        if next(iter(data)) == "error":
+        if "error" in data:
             error = data["error"]
             raise errors.APIError(error["code"], error["message"])
 
@@ -28,6 +28,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import logging
 import os
@@ -37,7 +38,7 @@ import typing as t
 import httpx
 
 import analytix
-from analytix import errors, oauth, ux
+from analytix import errors, oauth, utils, ux
 from analytix.queries import Query
 from analytix.reports import Report
 from analytix.secrets import Secrets
@@ -457,11 +458,13 @@ class AsyncAnalytics:
 
         assert self._tokens is not None
         headers = {"Authorization": f"Bearer {self._tokens.access_token}"}
-        resp = await self._session.get(query.url, headers=headers)
-        data = resp.json()
+        resp = await self._session.get(
+            analytix.API_BASE_URL, params=query.params, headers=headers
+        )
+        data = utils.load_json(resp.content)
         _log.debug(f"Data retrieved: {data}")
 
-        if next(iter(data)) == "error":
+        if "error" in data:
             error = data["error"]
             raise errors.APIError(error["code"], error["message"])
 
@@ -472,3 +475,95 @@ class AsyncAnalytics:
         report = Report(data, query.rtype)
         _log.info(f"Created report of shape {report.shape}!")
         return report
+
+    async def retrieve_many(
+        self,
+        requests: t.Iterable[dict[str, t.Any]],
+        *,
+        max_concurrency: int | None = None,
+        force_authorisation: bool = False,
+        skip_update_check: bool = False,
+        skip_refresh_check: bool = False,
+        token_path: pathlib.Path | str = ".",
+        port: int = 8080,
+    ) -> list[Report]:
+        """Retrieves multiple reports from the YouTube Analytics API
+        concurrently.
+
+        Args:
+            requests:
+                The requests to make. Each request should be a
+                dictionary of keyword arguments accepted by
+                :meth:`retrieve`.
+
+        Keyword Args:
+            max_concurrency:
+                The maximum number of requests to have in flight at
+                once. Defaults to ``None``. If this is ``None``, all
+                requests are made at the same time, and each counts
+                toward your quota. If any request fails, those still
+                pending are cancelled and the error is raised.
+            force_authorisation:
+                Whether to force the (re)authorisation of the client.
+                Defaults to ``False``.
+            skip_update_check:
+                Whether to skip checking for updates. Defaults to
+                ``False``.
+            skip_refresh_check:
+                Whether to skip token refreshing. Defaults to ``False``.
+            token_path:
+                The path to the token file or the directory the token
+                file is or should be stored in. If this is not provided,
+                this defaults to the current directory, and if a
+                directory is passed, the file is given the name
+                "tokens.json".
+            port:
+                The port to use for the authorisation webserver when
+                using loopback IP address authorisation. Defaults to
+                8080. This is ignored if analytix is configured to use
+                manual copy/paste authorisation.
+
+        Returns:
+            A list of instances for working with retrieved data, in the
+            same order as the requests.
+
+        .. versionadded:: 3.7.0
+        """
+
+        if max_concurrency is not None and max_concurrency < 1:
+            raise errors.InvalidRequest("the max concurrency should be positive")
+
+        # Authorise up front so concurrent requests don't all try to.
+        if not skip_update_check and not self._checked_for_update:
+            await self.check_for_updates()
+
+        if not self.authorised or force_authorisation:
+            await self.authorise(
+                token_path=token_path, force=force_authorisation, port=port
+            )
+
+        if (not skip_refresh_check) and await self.needs_refresh():
+            await self.refresh_access_token(port=port)
+
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def retrieve(request: dict[str, t.Any]) -> Report:
+            kwargs = {**request, "skip_update_check": True, "skip_refresh_check": True}
+
+            if semaphore is None:
+                return await self.retrieve(**kwargs)
+
+            async with semaphore:
+                return await self.retrieve(**kwargs)
+
+        tasks = [asyncio.ensure_future(retrieve(r)) for r in requests]
+
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave the other requests running (and using quota)
+            # once one of them has failed.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
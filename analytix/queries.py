@@ -40,6 +40,13 @@ from analytix.errors import InvalidRequest
 
 _log = logging.getLogger(__name__)
 
+_TYPE_CHECKS = (
+    ("max_results", int, "expected max results as integer"),
+    ("_start_date", dt.date, "expected start date as date object"),
+    ("_end_date", dt.date, "expected end date as date object"),
+    ("start_index", int, "expected start index as integer"),
+)
+
 
 class Query:
     __slots__ = (
@@ -97,7 +104,7 @@ class Query:
 
     @property
     def url(self) -> str:
-        filters = ";".join(f"{k}=={v}" for k, v in self.filters.items())
+        filters = ";".join([f"{k}=={v}" for k, v in self.filters.items()])
         return analytix.API_BASE_URL + (
             "ids=channel==MINE"
             f"&dimensions={','.join(self.dimensions)}"
@@ -112,20 +119,34 @@ class Query:
             f"&includeHistoricalData={self.include_historical_data}"
         )
 
+    @property
+    def params(self) -> dict[str, str]:
+        return {
+            "ids": "channel==MINE",
+            "dimensions": ",".join(self.dimensions),
+            "filters": ";".join([f"{k}=={v}" for k, v in self.filters.items()]),
+            "metrics": ",".join(self.metrics),
+            "sort": ",".join(self.sort_options),
+            "maxResults": f"{self.max_results}",
+            "startDate": self.start_date,
+            "endDate": self.end_date,
+            "currency": self.currency,
+            "startIndex": f"{self.start_index}",
+            "includeHistoricalData": self.include_historical_data,
+        }
+
     def validate(self) -> None:
         _log.info("Validating request...")
 
+        for attr, type_, message in _TYPE_CHECKS:
+            if not isinstance(getattr(self, attr), type_):
+                raise InvalidRequest(message)
+
         if self.max_results < 0:
             raise InvalidRequest(
                 "the max results should be non-negative (0 for unlimited results)"
             )
 
-        if not isinstance(self._start_date, dt.date):
-            raise InvalidRequest("expected start date as date object")
-
-        if not isinstance(self._end_date, dt.date):
-            raise InvalidRequest("expected end date as date object")
-
         if self._end_date < self._start_date:
             raise InvalidRequest("the start date should be earlier than the end date")
 
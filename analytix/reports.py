@@ -28,11 +28,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import csv
+import io
 import json
 import logging
 import typing as t
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from pathlib import Path
 
 import aiofiles
@@ -51,59 +55,116 @@ if t.TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+_UNQUOTED_DELIMITERS = frozenset({",", "\t", ";", "|", " "})
+
+
+def _with_extension(path: str, extension: str) -> Path:
+    file_path = Path(path)
+
+    if file_path.suffix.lower() != extension:
+        # Append rather than use `with_suffix` so names containing dots
+        # (such as "views.2022") are kept intact.
+        file_path = file_path.with_name(file_path.name + extension)
+
+    return file_path
+
 
 class JSONReportWriter(DynamicReportWriter):
     __slots__ = ()
 
+    def _use_orjson(self) -> bool:
+        # orjson only supports two-space indentation.
+        return self._indent == 2 and analytix.can_use("orjson")
+
     def _run_sync(self) -> None:
-        if not self._path.endswith(".json"):
-            self._path += ".json"
+        file_path = _with_extension(self._path, ".json")
 
-        with open(self._path, "w") as f:
-            json.dump(self._data, f, indent=self._indent)
+        if self._use_orjson():
+            import orjson
 
-        return _log.info(f"Saved report as JSON to {Path(self._path).resolve()}")
+            with open(file_path, "wb", buffering=1 << 20) as fb:
+                fb.write(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, "w", buffering=1 << 20) as f:
+                json.dump(self._data, f, indent=self._indent)
+
+        return _log.info(f"Saved report as JSON to {file_path.resolve()}")
 
     async def _run_async(self) -> None:
-        if not self._path.endswith(".json"):
-            self._path += ".json"
+        file_path = _with_extension(self._path, ".json")
+
+        # Serialising large reports is CPU-bound, so do it in a worker
+        # thread to avoid blocking the event loop.
+        loop = asyncio.get_running_loop()
+
+        if self._use_orjson():
+            import orjson
+
+            raw = await loop.run_in_executor(
+                None, partial(orjson.dumps, self._data, option=orjson.OPT_INDENT_2)
+            )
+
+            async with aiofiles.open(file_path, "wb") as fb:
+                await fb.write(raw)
+        else:
+            payload = await loop.run_in_executor(
+                None, partial(json.dumps, self._data, indent=self._indent)
+            )
 
-        async with aiofiles.open(self._path, "w") as f:
-            await f.write(json.dumps(self._data, indent=self._indent))
+            async with aiofiles.open(file_path, "w") as f:
+                await f.write(payload)
 
-        return _log.info(f"Saved report as JSON to {Path(self._path).resolve()}")
+        return _log.info(f"Saved report as JSON to {file_path.resolve()}")
 
 
 class CSVReportWriter(DynamicReportWriter):
     __slots__ = ()
 
+    def _can_skip_csv_module(self) -> bool:
+        # Numbers and ISO dates never contain these delimiters or any
+        # quotes, so only other string columns could need quoting.
+        return self._delimiter in _UNQUOTED_DELIMITERS and all(
+            h["dataType"] != "STRING" or h["name"] in ("day", "month")
+            for h in self._data["columnHeaders"]
+        )
+
+    def _render(self) -> str:
+        if self._can_skip_csv_module():
+            fmt = self._delimiter.join(["%s"] * len(self._columns)) + "\n"
+            body = "".join(map(fmt.__mod__, map(tuple, self._data["rows"])))
+
+            # Numbers and dates can't render as "None", so this only
+            # matches null cells, which the csv module writes as empty.
+            if "None" not in body:
+                return self._delimiter.join(self._columns) + "\n" + body
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=self._delimiter, lineterminator="\n")
+        writer.writerow(self._columns)
+        writer.writerows(self._data["rows"])
+        return buffer.getvalue()
+
     def _run_sync(self) -> None:
         extension = ".tsv" if self._delimiter == "\t" else ".csv"
 
-        if not self._path.endswith(extension):
-            self._path += extension
+        file_path = _with_extension(self._path, extension)
 
-        with open(self._path, "w") as f:
-            f.write(f"{self._delimiter.join(self._columns)}\n")
-            for row in self._data["rows"]:
-                line = self._delimiter.join(f"{v}" for v in row)
-                f.write(f"{line}\n")
+        with open(file_path, "w", newline="", encoding="utf-8") as f:
+            f.write(self._render())
 
-        return _log.info(f"Saved report as CSV to {Path(self._path).resolve()}")
+        return _log.info(f"Saved report as CSV to {file_path.resolve()}")
 
     async def _run_async(self) -> None:
         extension = ".tsv" if self._delimiter == "\t" else ".csv"
 
-        if not self._path.endswith(extension):
-            self._path += extension
+        file_path = _with_extension(self._path, extension)
 
-        async with aiofiles.open(self._path, "w") as f:
-            await f.write(f"{self._delimiter.join(self._columns)}\n")
-            for row in self._data["rows"]:
-                line = self._delimiter.join(f"{v}" for v in row)
-                await f.write(f"{line}\n")
+        # Build the file in memory so it can be written in one go --
+        # each write is a round trip to aiofiles' executor.
+        async with aiofiles.open(file_path, "w", newline="", encoding="utf-8") as f:
+            await f.write(self._render())
 
-        return _log.info(f"Saved report as CSV to {Path(self._path).resolve()}")
+        return _log.info(f"Saved report as CSV to {file_path.resolve()}")
 
 
 class ColumnType(Enum):
@@ -281,6 +342,13 @@ class Report:
 
         Returns:
             The newly created DataFrame.
+
+        .. versionchanged:: 3.7.0
+            Numeric columns now take their types from the column
+            headers. Float columns that only hold whole numbers are
+            now ``float64`` instead of ``int64``, and integer columns
+            are now forced to ``int64``, truncating any fractional part
+            (columns with missing values are ``float64``).
         """
 
         if analytix.can_use("modin"):
@@ -295,13 +363,36 @@ class Report:
                 "cannot convert to DataFrame as the returned data has no rows"
             )
 
-        df = pd.DataFrame(self.data["rows"], columns=self.columns)
+        # numpy is always available alongside pandas.
+        import numpy as np
+
+        # Build the frame column-wise, using the types provided by the
+        # API for numeric columns so pandas doesn't need to infer them
+        # cell by cell.
+        dtypes = {DataType.INTEGER: np.int64, DataType.FLOAT: np.float64}
+        nrows = self._shape[0]
+        cols: dict[str, t.Any] = {}
+
+        for header, values in zip(self._column_headers, zip(*self.data["rows"])):
+            dtype = dtypes.get(header.data_type)
+
+            if dtype is None:
+                cols[header.name] = values
+            elif None in values:
+                # Null cells become NaN, as they would if pandas
+                # inferred the type itself.
+                cols[header.name] = np.array(values, dtype=np.float64)
+            else:
+                cols[header.name] = np.fromiter(values, dtype=dtype, count=nrows)
+
+        df = pd.DataFrame(cols, copy=False)
 
         if not skip_date_conversion:
             s = {"day", "month"} & set(df.columns)
             if len(s):
                 col = next(iter(s))
-                df[col] = pd.to_datetime(df[col], format="%Y-%m-%d")
+                fmt = {"day": "%Y-%m-%d", "month": "%Y-%m"}[col]
+                df[col] = pd.to_datetime(df[col], format=fmt, cache=True)
                 _log.info(f"Converted {col!r} column to datetime64[ns] format")
 
         return df
@@ -379,7 +470,8 @@ class Report:
         Keyword Args:
             indent:
                 The amount of indentation the data should be written
-                with. Defaults to ``4``.
+                with. Defaults to ``4``. If this is ``2`` and orjson is
+                installed, orjson is used to serialise the data.
 
         Returns:
             The report writer. This is done to allow this method to run
@@ -448,19 +540,19 @@ class Report:
         else:
             raise errors.MissingOptionalComponents("openpyxl")
 
-        if not path.endswith(".xlsx"):
-            path += ".xlsx"
+        file_path = _with_extension(path, ".xlsx")
 
         wb = Workbook()
         ws = wb.active
         ws.title = sheet_name
 
-        ws.append(self.columns)
+        append = ws.append
+        append(self.columns)
         for row in self.data["rows"]:
-            ws.append(row)
+            append(row)
 
-        wb.save(path)
-        _log.info(f"Saved report as spreadsheet to {Path(path).resolve()}")
+        wb.save(file_path)
+        _log.info(f"Saved report as spreadsheet to {file_path.resolve()}")
 
     def to_feather(self, path: str) -> None:
         """Write the report data to an Apache Feather file.
@@ -477,11 +569,10 @@ class Report:
         else:
             raise errors.MissingOptionalComponents("pyarrow")
 
-        if not path.endswith(".feather"):
-            path += ".feather"
+        file_path = _with_extension(path, ".feather")
 
-        pf.write_feather(self.to_arrow_table(), path)
-        _log.info(f"Saved report as Apache Feather file to {Path(path).resolve()}")
+        pf.write_feather(self.to_arrow_table(), file_path)
+        _log.info(f"Saved report as Apache Feather file to {file_path.resolve()}")
 
     def to_parquet(self, path: str) -> None:
         """Write the report data to an Apache Parquet file.
@@ -498,8 +589,7 @@ class Report:
         else:
             raise errors.MissingOptionalComponents("pyarrow")
 
-        if not path.endswith(".parquet"):
-            path += ".parquet"
+        file_path = _with_extension(path, ".parquet")
 
-        pq.write_table(self.to_arrow_table(), path)
-        _log.info(f"Saved report as Apache Parquet file to {Path(path).resolve()}")
+        pq.write_table(self.to_arrow_table(), file_path)
+        _log.info(f"Saved report as Apache Parquet file to {file_path.resolve()}")
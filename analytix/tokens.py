@@ -28,19 +28,46 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
 import pathlib
+import stat
+import tempfile
 import typing as t
 from dataclasses import dataclass
 
 import aiofiles
 
+from analytix import utils
 from analytix.types import TokenT
 
 _log = logging.getLogger(__name__)
 
 
+def _write_atomic(path: pathlib.Path, raw: bytes) -> None:
+    # Write to a temporary file in the same directory and swap it in,
+    # so a crash mid-write never leaves a partially written file.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # mkstemp creates files readable only by their owner. Keep the
+        # permissions of any file being replaced; new files stay
+        # owner-only, as they hold credentials.
+        if path.exists():
+            os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
 @dataclass()
 class Tokens:
     """A dataclass representing a set of tokens for a Google Developers
@@ -104,8 +131,7 @@ class Tokens:
 
         _log.debug(f"Loading tokens from {path.resolve()}...")
 
-        with open(path) as f:
-            data = json.load(f)
+        data = utils.load_json(path.read_bytes())
 
         _log.info("Tokens loaded!")
         return cls(**data)
@@ -128,8 +154,8 @@ class Tokens:
 
         _log.debug(f"Loading tokens from {path.resolve()}...")
 
-        async with aiofiles.open(path) as f:
-            data = json.loads(await f.read())
+        async with aiofiles.open(path, "rb") as f:
+            data = utils.load_json(await f.read())
 
         _log.info("Tokens loaded!")
         return cls(**data)
@@ -172,13 +198,16 @@ class Tokens:
         Args:
             path:
                 The path to the tokens file.
+
+        .. versionchanged:: 3.7.0
+            Files are now written atomically. New files are only
+            readable and writable by their owner.
         """
 
         if not isinstance(path, pathlib.Path):
             path = pathlib.Path(path)
 
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f)
+        _write_atomic(path, utils.dump_json(self.to_dict()))
 
         _log.info(f"Tokens saved to {path.resolve()}")
 
@@ -188,12 +217,18 @@ class Tokens:
         Args:
             path:
                 The path to the tokens file.
+
+        .. versionchanged:: 3.7.0
+            Files are now written atomically. New files are only
+            readable and writable by their owner.
         """
 
         if not isinstance(path, pathlib.Path):
             path = pathlib.Path(path)
 
-        async with aiofiles.open(path, "w") as f:
-            await f.write(json.dumps(self.to_dict()))
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, _write_atomic, path, utils.dump_json(self.to_dict())
+        )
 
         _log.info(f"Tokens saved to {path.resolve()}")
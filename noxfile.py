@@ -71,7 +71,7 @@ def fetch_installs(*categories: str) -> list[str]:
 
 @nox.session(reuse_venv=True)
 def tests(session: nox.Session) -> None:
-    session.install(*fetch_installs("Tests"), ".[pandas,excel,arrow,polars]")
+    session.install(*fetch_installs("Tests"), ".[pandas,excel,json,arrow,polars]")
     session.run(
         "coverage",
         "run",
@@ -118,6 +118,7 @@ setuptools.setup(
         "dev": parse_requirements("./requirements/dev.txt"),
         "df": parse_requirements("./requirements/df.txt"),
         "excel": parse_requirements("./requirements/excel.txt"),
+        "json": parse_requirements("./requirements/json.txt"),
         "modin": parse_requirements("./requirements/modin.txt"),
         "pandas": parse_requirements("./requirements/df.txt"),
         "polars": parse_requirements("./requirements/polars.txt"),
@@ -36,6 +36,7 @@ import httpx
 import mock
 import pytest
 
+import analytix
 from analytix import Analytics
 from analytix.errors import APIError, AuthenticationError
 from analytix.report_types import TimeBasedActivity
@@ -337,6 +338,29 @@ def test_retrieve(client, request_data, tokens):
         assert isinstance(report.type, TimeBasedActivity)
 
 
+def test_retrieve_without_orjson(client, request_data, tokens):
+    with mock.patch.object(httpx.Client, "get") as mock_get:
+        with mock.patch.object(analytix, "can_use") as mock_cu:
+            mock_cu.return_value = False
+            client._tokens = tokens
+
+            mock_get.return_value = httpx.Response(
+                status_code=200,
+                request=mock.Mock(),
+                json=request_data,
+            )
+
+            report = client.retrieve(
+                dimensions=("day",),
+                start_date=dt.date(2022, 1, 1),
+                end_date=dt.date(2022, 1, 31),
+                skip_update_check=True,
+                skip_refresh_check=True,
+            )
+            mock_get.assert_called_once()
+            assert report.data == request_data
+
+
 def test_retrieve_version_check(client, request_data, tokens):
     with mock.patch.object(httpx.Client, "get") as mock_get:
         client._tokens = tokens
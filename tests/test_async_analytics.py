@@ -28,6 +28,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import builtins
 import datetime as dt
 import json
@@ -40,8 +41,9 @@ import mock
 import pytest
 import pytest_asyncio
 
+import analytix
 from analytix import AsyncAnalytics
-from analytix.errors import APIError, AuthenticationError
+from analytix.errors import APIError, AuthenticationError, InvalidRequest
 from analytix.report_types import TimeBasedActivity
 from analytix.secrets import Secrets
 from analytix.tokens import Tokens
@@ -337,6 +339,134 @@ async def test_retrieve(client, request_data, tokens):
         assert isinstance(report.type, TimeBasedActivity)
 
 
+async def test_retrieve_many(client, request_data, tokens):
+    with mock.patch.object(httpx.AsyncClient, "get") as mock_get:
+        client._tokens = tokens
+
+        mock_get.return_value = httpx.Response(
+            status_code=200,
+            request=mock.Mock(),
+            json=request_data,
+        )
+
+        reports = await client.retrieve_many(
+            [
+                {
+                    "dimensions": ("day",),
+                    "start_date": dt.date(2022, 1, 1),
+                    "end_date": dt.date(2022, 1, 31),
+                },
+                {
+                    "dimensions": ("day",),
+                    "start_date": dt.date(2022, 2, 1),
+                    "end_date": dt.date(2022, 2, 28),
+                },
+            ],
+            skip_update_check=True,
+            skip_refresh_check=True,
+        )
+        assert mock_get.call_count == 2
+        assert len(reports) == 2
+        for report in reports:
+            assert report.data == request_data
+            assert isinstance(report.type, TimeBasedActivity)
+
+
+async def test_retrieve_many_max_concurrency(client, request_data, tokens):
+    in_flight = 0
+    peak = 0
+
+    async def fake_get(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return httpx.Response(status_code=200, request=mock.Mock(), json=request_data)
+
+    with mock.patch.object(httpx.AsyncClient, "get") as mock_get:
+        mock_get.side_effect = fake_get
+        client._tokens = tokens
+
+        reports = await client.retrieve_many(
+            [{"dimensions": ("day",)}] * 5,
+            max_concurrency=2,
+            skip_update_check=True,
+            skip_refresh_check=True,
+        )
+        assert mock_get.call_count == 5
+        assert len(reports) == 5
+        assert peak == 2
+
+
+async def test_retrieve_many_invalid_max_concurrency(client):
+    with pytest.raises(InvalidRequest) as exc:
+        await client.retrieve_many([], max_concurrency=0)
+    assert str(exc.value) == "the max concurrency should be positive"
+
+
+async def test_retrieve_many_cancels_pending_on_error(client, request_data, tokens):
+    calls = 0
+    cancelled = 0
+
+    async def fake_get(*args, **kwargs):
+        nonlocal calls, cancelled
+        calls += 1
+
+        if calls == 1:
+            return httpx.Response(
+                status_code=200,
+                request=mock.Mock(),
+                json={"error": {"code": 400, "message": "bad request"}},
+            )
+
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return httpx.Response(status_code=200, request=mock.Mock(), json=request_data)
+
+    with mock.patch.object(httpx.AsyncClient, "get") as mock_get:
+        mock_get.side_effect = fake_get
+        client._tokens = tokens
+
+        with pytest.raises(APIError):
+            await asyncio.wait_for(
+                client.retrieve_many(
+                    [{"dimensions": ("day",)}] * 3,
+                    skip_update_check=True,
+                    skip_refresh_check=True,
+                ),
+                timeout=5,
+            )
+        assert calls == 3
+        assert cancelled == 2
+
+
+async def test_retrieve_without_orjson(client, request_data, tokens):
+    with mock.patch.object(httpx.AsyncClient, "get") as mock_get:
+        with mock.patch.object(analytix, "can_use") as mock_cu:
+            mock_cu.return_value = False
+            client._tokens = tokens
+
+            mock_get.return_value = httpx.Response(
+                status_code=200,
+                request=mock.Mock(),
+                json=request_data,
+            )
+
+            report = await client.retrieve(
+                dimensions=("day",),
+                start_date=dt.date(2022, 1, 1),
+                end_date=dt.date(2022, 1, 31),
+                skip_update_check=True,
+                skip_refresh_check=True,
+            )
+            mock_get.assert_called_once()
+            assert report.data == request_data
+
+
 async def test_retrieve_version_check(client, request_data, tokens):
     with mock.patch.object(httpx.AsyncClient, "get") as mock_get:
         client._tokens = tokens
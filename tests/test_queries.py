@@ -117,6 +117,22 @@ def test_url_property(query):
     )
 
 
+def test_params_property(query):
+    assert query.params == {
+        "ids": "channel==MINE",
+        "dimensions": "day,country",
+        "filters": "continent==002;deviceType==MOBILE",
+        "metrics": "views,likes,comments",
+        "sort": "shares,dislikes",
+        "maxResults": "0",
+        "startDate": "2021-01-01",
+        "endDate": "2021-12-31",
+        "currency": "USD",
+        "startIndex": "1",
+        "includeHistoricalData": "false",
+    }
+
+
 def test_validate_max_results():
     query = Query(max_results=-1)
     with pytest.raises(InvalidRequest) as exc:
@@ -127,6 +143,13 @@ def test_validate_max_results():
     )
 
 
+def test_validate_max_results_is_int():
+    query = Query(max_results="10")
+    with pytest.raises(InvalidRequest) as exc:
+        query.validate()
+    assert str(exc.value) == "expected max results as integer"
+
+
 def test_validate_start_date_is_date():
     query = Query(start_date="2021-01-01")
     with pytest.raises(InvalidRequest) as exc:
@@ -162,6 +185,13 @@ def test_validate_start_index():
     assert str(exc.value) == "the start index should be positive"
 
 
+def test_validate_start_index_is_int():
+    query = Query(start_index="1")
+    with pytest.raises(InvalidRequest) as exc:
+        query.validate()
+    assert str(exc.value) == "expected start index as integer"
+
+
 def test_validate_months_are_corrected():
     query = Query(
         dimensions=["month"],
@@ -260,6 +260,29 @@ async def test_await_to_json_no_extension(report, request_data):
     os.remove(JSON_OUTPUT_PATH)
 
 
+def test_to_json_uppercase_extension(report, request_data):
+    path = JSON_OUTPUT_PATH.with_suffix(".JSON")
+    report.to_json(str(path))
+    assert path.is_file()
+    assert not path.with_name(path.name + ".json").is_file()
+
+    with open(path) as f:
+        assert json.load(f) == request_data
+
+    os.remove(path)
+
+
+def test_to_json_dotted_name(report, request_data):
+    path = JSON_OUTPUT_PATH.with_name("views.2022.json")
+    report.to_json(str(JSON_OUTPUT_PATH.with_name("views.2022")))
+    assert path.is_file()
+
+    with open(path) as f:
+        assert json.load(f) == request_data
+
+    os.remove(path)
+
+
 async def test_deprecated_ato_json_no_extension(report, request_data):
     await report.ato_json(str(JSON_OUTPUT_PATH)[:-5])
     assert JSON_OUTPUT_PATH.is_file()
@@ -270,6 +293,26 @@ async def test_deprecated_ato_json_no_extension(report, request_data):
     os.remove(JSON_OUTPUT_PATH)
 
 
+def test_to_json_orjson(report, request_data):
+    report.to_json(str(JSON_OUTPUT_PATH), indent=2)
+    assert JSON_OUTPUT_PATH.is_file()
+
+    with open(JSON_OUTPUT_PATH) as f:
+        assert json.load(f) == request_data
+
+    os.remove(JSON_OUTPUT_PATH)
+
+
+async def test_await_to_json_orjson(report, request_data):
+    await report.to_json(str(JSON_OUTPUT_PATH), indent=2)
+    assert JSON_OUTPUT_PATH.is_file()
+
+    with open(JSON_OUTPUT_PATH) as f:
+        assert json.load(f) == request_data
+
+    os.remove(JSON_OUTPUT_PATH)
+
+
 @pytest.fixture()
 def mock_csv_data():
     with open(MOCK_CSV_PATH) as f:
@@ -336,6 +379,61 @@ async def test_deprecated_ato_csv_no_extension(report, mock_csv_data):
     os.remove(CSV_OUTPUT_PATH)
 
 
+def test_to_csv_quotes_string_columns(request_data, report_type):
+    request_data["columnHeaders"][0]["name"] = "video"
+    request_data["rows"] = [["a,b", *request_data["rows"][0][1:]]]
+
+    Report(request_data, report_type).to_csv(str(CSV_OUTPUT_PATH))
+
+    with open(CSV_OUTPUT_PATH) as f:
+        assert f.readlines()[1].startswith('"a,b",759,')
+
+    os.remove(CSV_OUTPUT_PATH)
+
+
+@pytest.mark.parametrize("null_cell", [False, True])
+def test_csv_render_paths_match(request_data, report_type, null_cell):
+    if null_cell:
+        request_data["rows"][0][1] = None
+
+    writer = Report(request_data, report_type).to_csv(str(CSV_OUTPUT_PATH))
+    os.remove(CSV_OUTPUT_PATH)
+    assert writer._can_skip_csv_module()
+    fast = writer._render()
+
+    with mock.patch.object(CSVReportWriter, "_can_skip_csv_module") as mock_skip:
+        mock_skip.return_value = False
+        slow = writer._render()
+
+    assert fast.encode("utf-8") == slow.encode("utf-8")
+    assert ("2022-01-01,,82," in fast) is null_cell
+
+
+def test_to_csv_percent_delimiter(report, mock_csv_data):
+    report.to_csv(str(CSV_OUTPUT_PATH), delimiter="%")
+    assert CSV_OUTPUT_PATH.is_file()
+
+    with open(CSV_OUTPUT_PATH) as f:
+        assert f.read() == mock_csv_data.replace(",", "%")
+
+    os.remove(CSV_OUTPUT_PATH)
+
+
+@pytest.mark.parametrize(
+    "path,delimiter", [(CSV_OUTPUT_PATH, ","), (TSV_OUTPUT_PATH, "\t")]
+)
+def test_to_csv_uppercase_extension(report, mock_csv_data, path, delimiter):
+    path = path.with_suffix(path.suffix.upper())
+    report.to_csv(str(path), delimiter=delimiter)
+    assert path.is_file()
+    assert not path.with_name(path.name + path.suffix.lower()).is_file()
+
+    with open(path) as f:
+        assert f.read() == mock_csv_data.replace(",", delimiter)
+
+    os.remove(path)
+
+
 def test_to_tsv(report, mock_csv_data):
     report.to_csv(str(TSV_OUTPUT_PATH), delimiter="\t")
     assert TSV_OUTPUT_PATH.is_file()
@@ -410,6 +508,41 @@ def test_to_dataframe(report, request_data):
         assert list(row)[1:] == request_data["rows"][i][1:]
 
 
+@pytest.mark.skipif(not analytix.can_use("pandas"), reason="pandas is not installed")
+def test_to_dataframe_dtypes_from_headers(report):
+    df = report.to_dataframe()
+
+    for header in report.column_headers:
+        if header.data_type == DataType.INTEGER:
+            assert df[header.name].dtype == "int64"
+        elif header.data_type == DataType.FLOAT:
+            assert df[header.name].dtype == "float64"
+
+
+@pytest.mark.skipif(not analytix.can_use("pandas"), reason="pandas is not installed")
+def test_to_dataframe_null_cells(request_data, report_type):
+    request_data["rows"][0][1] = None
+    request_data["rows"][1][12] = None
+
+    df = Report(request_data, report_type).to_dataframe()
+    assert df["views"].dtype == "float64"
+    assert pd.isna(df["views"][0])
+    assert df["views"][1] == request_data["rows"][1][1]
+    assert pd.isna(df["averageViewPercentage"][1])
+    assert df["redViews"].dtype == "int64"
+
+
+@pytest.mark.skipif(not analytix.can_use("pandas"), reason="pandas is not installed")
+def test_to_dataframe_month_conversion(request_data, report_type):
+    request_data["columnHeaders"][0]["name"] = "month"
+    for i, row in enumerate(request_data["rows"]):
+        row[0] = f"2022-{i % 12 + 1:02}"
+
+    df = Report(request_data, report_type).to_dataframe()
+    assert df["month"].dtype.kind == "M"
+    assert df["month"][0] == pd.Timestamp(2022, 1, 1)
+
+
 @pytest.mark.skipif(
     sys.version_info >= (3, 11, 0) or platform.python_implementation() != "CPython",
     reason="pandas does not support Python 3.11 or PyPy",
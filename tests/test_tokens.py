@@ -31,10 +31,13 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import stat
 import typing as t
 
+import mock
 import pytest
 
+import analytix
 from analytix.tokens import Tokens
 from tests.paths import SECRETS_PATH, TOKENS_PATH
 
@@ -157,3 +160,48 @@ def test_write_path_str_async(tokens):
     asyncio.run(tokens.awrite(str(SECRETS_PATH.parent / "test_write.json")))
     assert (SECRETS_PATH.parent / "test_write.json").is_file()
     os.remove(SECRETS_PATH.parent / "test_write.json")
+
+
+def test_write_and_load_without_orjson(tokens):
+    path = SECRETS_PATH.parent / "test_write.json"
+
+    with mock.patch.object(analytix, "can_use") as mock_cu:
+        mock_cu.return_value = False
+
+        tokens.write(path)
+        assert Tokens.from_file(path) == tokens
+
+    os.remove(path)
+
+
+def test_write_replaces_existing_file(tokens):
+    path = SECRETS_PATH.parent / "test_write.json"
+    path.write_text("partial")
+
+    tokens.write(path)
+    assert Tokens.from_file(path) == tokens
+    assert not list(path.parent.glob(".test_write.json.*"))
+
+    os.remove(path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows does not support POSIX modes")
+def test_write_keeps_existing_file_mode(tokens):
+    path = SECRETS_PATH.parent / "test_write.json"
+    path.write_text("partial")
+    os.chmod(path, 0o644)
+
+    tokens.write(path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    os.remove(path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows does not support POSIX modes")
+def test_write_new_file_is_owner_only(tokens):
+    path = SECRETS_PATH.parent / "test_write.json"
+
+    tokens.write(path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    os.remove(path)